@@ -1,30 +1,107 @@
 import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from logger_setup import Logger_Setup
 
+try:
+    import pyarrow
+    _READ_KW = {'engine': 'pyarrow'}
+except ImportError:
+    _READ_KW = {}
+
+ALLOWED_FILES = frozenset({'buses.csv', 'generators.csv', 'storage_units.csv', 'loads.csv', 'lines.csv', 'transformers.csv', 'links.csv'})
+
+# Low-cardinality string columns are parsed straight into categoricals.
+# Numeric columns are left to inference so values reach PyPSA as float64.
+_SCHEMA = {
+    'buses.csv': {'carrier': 'category', 'control': 'category', 'zone': 'category'},
+    'generators.csv': {'bus': 'category', 'control': 'category'},
+    'storage_units.csv': {'bus': 'category'},
+    'loads.csv': {'bus': 'category', 'carrier': 'category'},
+    'lines.csv': {'bus0': 'category', 'bus1': 'category', 'carrier': 'category'},
+    'transformers.csv': {'bus0': 'category', 'bus1': 'category'},
+    'links.csv': {'bus0': 'category', 'bus1': 'category', 'control_type': 'category', 'carrier': 'category'},
+}
+
+def _file_version(file_path):
+    # Nanosecond mtime plus size, so a rewrite within one coarse mtime tick still changes the key
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+@lru_cache(maxsize=128)
+def _read_csv_cached(file_path, version):
+    # version is part of the cache key so edited files are re-parsed
+    dtype = _SCHEMA.get(os.path.basename(file_path))
+    if not _READ_KW:
+        # Empty files cannot be mapped; let pandas report them as usual
+        return pd.read_csv(file_path, dtype=dtype, memory_map=os.path.getsize(file_path) > 0)
+    try:
+        # Parse straight from the page cache instead of a buffered copy
+        with pyarrow.memory_map(file_path, 'r') as source:
+            return pd.read_csv(source, dtype=dtype, **_READ_KW)
+    except pd.errors.ParserError:
+        # pandas re-raises pyarrow's ArrowInvalid as ParserError; let the
+        # C engine handle (or report) anything pyarrow rejects
+        return pd.read_csv(file_path, dtype=dtype)
+
+@lru_cache(maxsize=128)
+def _read_parquet_cached(file_path, version):
+    return pd.read_parquet(file_path)
+
 class Data_Loader:
     def __init__(self, data_folder):
         self.data_folder = data_folder
         self.logger = Logger_Setup.setup_logger('DataLoader')
+        self._paths = {name: os.path.abspath(os.path.join(data_folder, name)) for name in ALLOWED_FILES}
 
     def _sanitize_file_name(self, file_name):
-        allowed_files = {'buses.csv', 'generators.csv', 'storage_units.csv', 'loads.csv', 'lines.csv', 'transformers.csv', 'links.csv'}
-        if file_name not in allowed_files:
+        if file_name not in ALLOWED_FILES:
             raise ValueError(f"Invalid file name: {file_name}")
         return file_name
 
+    def _parquet_path(self, csv_path):
+        """
+        Return the Parquet copy of csv_path if it exists and is not older than the CSV.
+        """
+        parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+        if not _READ_KW or not os.path.exists(parquet_path):
+            return None
+        if os.path.exists(csv_path) and os.path.getmtime(parquet_path) < os.path.getmtime(csv_path):
+            return None
+        return parquet_path
+
     def read_csv(self, file_name):
-        try:
-            sanitized_file_name = self._sanitize_file_name(file_name)
-            file_path = os.path.join(self.data_folder, sanitized_file_name)
-            return pd.read_csv(file_path)
-        except ValueError as ve:
-            self.logger.error(ve)
-        except FileNotFoundError:
-            self.logger.error(f"File {file_name} not found in the data folder.")
-        except pd.errors.EmptyDataError:
-            self.logger.error(f"File {file_name} is empty.")
-        except Exception as e:
-            self.logger.error(f"An error occurred while reading file {file_name}.")
-            self.logger.error(e)
-        return pd.DataFrame()
\ No newline at end of file
+        # Errors propagate to the caller, which logs them once
+        file_path = self._paths[self._sanitize_file_name(file_name)]
+        parquet_path = self._parquet_path(file_path)
+        # Hand out a copy so callers can never mutate the cached frame
+        if parquet_path is not None:
+            return _read_parquet_cached(parquet_path, _file_version(parquet_path)).copy()
+        return _read_csv_cached(file_path, _file_version(file_path)).copy()
+
+    def read_all(self, file_names):
+        """
+        Read several data files concurrently and return them keyed by file name.
+        """
+        file_names = list(file_names)
+        if not file_names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(file_names))) as executor:
+            return dict(zip(file_names, executor.map(self.read_csv, file_names)))
+
+    def convert_to_parquet(self):
+        """
+        Write a zstd-compressed Parquet copy next to each component CSV.
+        read_csv prefers these copies for as long as they are newer than the CSV.
+        """
+        if not _READ_KW:
+            self.logger.error("pyarrow is required to write Parquet files.")
+            return
+        for file_name in sorted(ALLOWED_FILES):
+            file_path = self._paths[file_name]
+            if not os.path.exists(file_path):
+                continue
+            data = _read_csv_cached(file_path, _file_version(file_path))
+            data.to_parquet(os.path.splitext(file_path)[0] + '.parquet', compression='zstd', index=False)
+            self.logger.info("Converted %s to Parquet.", file_name)
\ No newline at end of file
@@ -1,13 +1,20 @@
 import logging
+from functools import lru_cache
+
+_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 
 class Logger_Setup:
     @staticmethod
+    @lru_cache(maxsize=None)
     def setup_logger(name):
         logger = logging.getLogger(name)
+        # Loggers are process-wide; configure each name only once so repeated
+        # setup does not stack duplicate handlers
+        if logger.handlers:
+            return logger
         logger.setLevel(logging.INFO)
         handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FORMATTER)
         logger.addHandler(handler)
         logger.propagate = False
         return logger
\ No newline at end of file
@@ -1,19 +1,26 @@
+import numpy as np
 from network_setup import Network_Setup
-from data_loader import Data_Loader
 from logger_setup import Logger_Setup
 
 class Network_Analysis:
   """
   Network_Analysis class for analyzing a PyPSA network.
   Attributes:
-      network_setup (Network_Setup): Instance of the Network_Setup class.
+      network_setup (Network_Setup): Instance of the Network_Setup class, or None when an existing network is passed in.
+      network (pypsa.Network): The network being analyzed.
   """
-  def __init__(self, data_folder):
-    self.data_loader = Data_Loader(data_folder)
-    self.network_setup = Network_Setup(data_folder)
-    self.network_setup.setup_network()
-    self.network = self.network_setup.get_network()
+  def __init__(self, data_folder=None, network=None):
+    # Reuse an already built network when given; otherwise build it once from data_folder
+    if data_folder is None and network is None:
+      raise ValueError("data_folder or network is required")
+    self.network_setup = None
+    if network is None:
+      self.network_setup = Network_Setup(data_folder)
+      self.network_setup.setup_network()
+      network = self.network_setup.get_network()
+    self.network = network
     self.logger = Logger_Setup.setup_logger('NetworkAnalysis')
+    self._consistency_checked = False
 
   def analyze_network(self):
     self.logger.info("Analyzing network...\n")
@@ -30,8 +37,12 @@ class Network_Analysis:
     """
     Check the consistency of the network.
     """
+    if self._consistency_checked:
+      self.logger.info("Consistency check already passed, skipping.\n")
+      return
     self.logger.info("Running consistency check...\n")
     self.network.consistency_check()
+    self._consistency_checked = True
     self.logger.info("Consistency check completed successfully!\n")
 
 
@@ -40,7 +51,7 @@ class Network_Analysis:
     Determine voltage, current, and power flows in each line, and voltages at each bus under steady-state conditions.
     """
     self.logger.info("Running Power Flow analysis...\n")
-    self.network_setup.network.pf()
+    self.network.pf()
     self.logger.info("Power Flow analysis completed successfully!\n")
 
   def _run_opf(self):
@@ -48,13 +59,16 @@ class Network_Analysis:
     Determine the optimal generation dispatch while minimizing cost, maximizing efficiency, or reducing emissions.
     """
     self.logger.info("Running Optimal Power Flow analysis...\n")
-    self.network_setup.network.optimize()
+    self.network.optimize()
     self.logger.info("Optimal Power Flow analysis completed successfully!\n")
 
   def _run_storage_analysis(self):
     """
     Evaluate how the storage system performs over time, including charge and discharge cycles.
     """
+    if self.network.storage_units.empty:
+      self.logger.info("No storage units in the network, skipping Storage analysis.\n")
+      return
     self.logger.info("Running Storage analysis...\n")
     #self.network_setup.network.storage_analysis()
     self.logger.info("Storage analysis completed successfully!\n")
@@ -79,13 +93,18 @@ class Network_Analysis:
     """
     Evaluate the losses in the network, including line, bus, and transformer losses
     """
-    line_losses = self.network_setup.network.lines_t.p0 - self.network_setup.network.lines_t.p1
-    self.logger.info(f"Line losses: {line_losses.sum().sum()}")
-    bus_losses = self.network_setup.network.buses_t.p_set.sum(axis=1) - self.network_setup.network.buses_t.p.sum(axis=1)
-    self.logger.info(f"Bus losses: {bus_losses.sum()}")
-    transformer_losses = self.network_setup.network.transformers_t.p0 - self.network_setup.network.transformers_t.p1
-    self.logger.info(f"Transformer losses: {transformer_losses.sum().sum()}")
-    self.logger.info(f"Total losses: {line_losses.sum().sum() + bus_losses.sum() + transformer_losses.sum().sum()}")
+    network = self.network
+    # Reduce plain ndarrays instead of building intermediate DataFrames/Series;
+    # nansum matches pandas' NaN skipping
+    line_losses = np.nansum(network.lines_t.p0.to_numpy() - network.lines_t.p1.to_numpy())
+    self.logger.info("Line losses: %s", line_losses)
+    bus_losses = np.nansum(network.buses_t.p_set.to_numpy()) - np.nansum(network.buses_t.p.to_numpy())
+    self.logger.info("Bus losses: %s", bus_losses)
+    transformer_losses = 0.0
+    if not network.transformers.empty:
+      transformer_losses = np.nansum(network.transformers_t.p0.to_numpy() - network.transformers_t.p1.to_numpy())
+    self.logger.info("Transformer losses: %s", transformer_losses)
+    self.logger.info("Total losses: %s", line_losses + bus_losses + transformer_losses)
 
   def main(data_folder):
     data_folder = 'data'
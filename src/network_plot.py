@@ -1,108 +1,133 @@
+import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 import cartopy.crs as ccrs
-import cartopy.feature as cfeature
-from data_loader import Data_Loader
+import pypsa
 from network_setup import Network_Setup
 from logger_setup import Logger_Setup
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from typing import Any, Optional, Tuple
+
+_PLATE_CARREE = ccrs.PlateCarree()
 
 class Network_Plot:
-  def __init__(self, data_folder: str) -> None:
-    self.data_loader = Data_Loader(data_folder)
-    self.network_setup = Network_Setup(data_folder)
-    self.network_setup.setup_network()
-    self.network = self.network_setup.get_network()
+  def __init__(self, data_folder: Optional[str] = None, network: Optional[pypsa.Network] = None) -> None:
+    # Reuse an already built network when given; otherwise build it once from data_folder
+    if data_folder is None and network is None:
+      raise ValueError("data_folder or network is required")
+    self.network_setup: Optional[Network_Setup] = None
+    if network is None:
+      self.network_setup = Network_Setup(data_folder)
+      self.network_setup.setup_network()
+      network = self.network_setup.get_network()
+    self.network = network
     self.logger = Logger_Setup.setup_logger('NetworkPlot')
+    self._bus_xy = None
+
+  def _bus_coordinates(self, bus_names: pd.Series) -> np.ndarray:
+    """
+    Return the (x, y) coordinates of the given buses as an (N, 2) array.
+    """
+    bus_xy = self._bus_xy if self._bus_xy is not None else self.network.buses[['x', 'y']]
+    return bus_xy.reindex(bus_names).to_numpy()
+
+  def _drop_unknown_buses(self, component: str, df: pd.DataFrame, *bus_columns: str) -> pd.DataFrame:
+    """
+    Drop rows of df that reference buses missing from the network, logging how many were skipped.
+    """
+    valid = np.logical_and.reduce([df[column].isin(self.network.buses.index).to_numpy() for column in bus_columns])
+    if valid.all():
+      return df
+    self.logger.warning("Skipping %d %s connected to unknown buses.", (~valid).sum(), component)
+    return df[valid]
+
+  def _segments(self, component: str) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Return the rows of a two-bus component ('lines', 'links' or 'transformers') whose buses exist,
+    together with their (N, 2, 2) endpoint coordinates read from the current bus table.
+    """
+    valid = self._drop_unknown_buses(component, getattr(self.network, component), 'bus0', 'bus1')
+    return valid, np.stack([self._bus_coordinates(valid.bus0), self._bus_coordinates(valid.bus1)], axis=1)
+
+  def _draw_connection_collection(self, ax: Axes, connections: pd.DataFrame, segments: np.ndarray, **style: Any) -> None:
+    """
+    Draw two-bus components as one LineCollection and label them at their midpoints.
+    """
+    ax.add_collection(LineCollection(segments, transform=_PLATE_CARREE, linewidths=1.5, zorder=1, **style))
+    self._draw_labels(ax, segments.mean(axis=1), connections.index, ha='center')
+
+  def _draw_labels(self, ax: Axes, xy: np.ndarray, names: pd.Index, ha: str) -> None:
+    """
+    Label each point, skipping points outside the current map extent.
+    """
+    x_min, x_max, y_min, y_max = ax.get_extent(crs=_PLATE_CARREE)
+    visible = (xy[:, 0] >= x_min) & (xy[:, 0] <= x_max) & (xy[:, 1] >= y_min) & (xy[:, 1] <= y_max)
+    for (x, y), name in zip(xy[visible], np.asarray(names)[visible]):
+      ax.text(x, y, name, transform=_PLATE_CARREE, fontsize=8, zorder=5, ha=ha)
 
   def plot_buses(self, ax: Axes) -> None:
+    xy = self.network.buses[['x', 'y']].to_numpy()
     ax.scatter(
-      self.network.buses.x, self.network.buses.y, transform=ccrs.PlateCarree(),
+      xy[:, 0], xy[:, 1], transform=_PLATE_CARREE,
       s=200, color='red', zorder=5, label='Buses'
     )
-    for bus_name, bus in self.network.buses.iterrows():
-      ax.text(
-        bus.x, bus.y, bus_name, transform=ccrs.PlateCarree(),
-        fontsize=8, zorder=5, ha='right'
-      )
+    self._draw_labels(ax, xy, self.network.buses.index, ha='right')
 
   def plot_lines(self, ax: Axes) -> None:
-    for _, line in self.network.lines.iterrows():
-      bus0 = self.network.buses.loc[line.bus0]
-      bus1 = self.network.buses.loc[line.bus1]
-      line_color = 'black' if line.s_nom > 100 else 'gray'
-      line_style = '--' if line.type == 'MV_line' else '-'
-      ax.plot(
-        [bus0.x, bus1.x], [bus0.y, bus1.y], transform=ccrs.PlateCarree(),
-        color=line_color, linestyle=line_style, linewidth=1.5, zorder=1
-      )
-      ax.text(
-        0.5 * (bus0.x + bus1.x), 0.5 * (bus0.y + bus1.y), line.name,
-        transform=ccrs.PlateCarree(), fontsize=8, zorder=5, ha='center'
-      )
+    lines, segments = self._segments('lines')
+    self._draw_connection_collection(
+      ax, lines, segments,
+      colors=np.where(lines.s_nom.to_numpy() > 100, 'black', 'gray').tolist(),
+      linestyles=np.where(lines.type.to_numpy() == 'MV_line', '--', '-').tolist()
+    )
 
   def plot_generators(self, ax: Axes) -> None:
-    for _, gen in self.network.generators.iterrows():
-      bus = self.network.buses.loc[gen.bus]
-      ax.plot(
-        bus.x, bus.y, marker='o', markersize=10, color='yellow',
-        transform=ccrs.PlateCarree(), zorder=5, label='Generators'
-      )
-      ax.text(
-        bus.x, bus.y, gen.name, transform=ccrs.PlateCarree(),
-        fontsize=8, zorder=5, ha='left'
-      )
+    generators = self._drop_unknown_buses('generators', self.network.generators, 'bus')
+    if generators.empty:
+      return
+    xy = self._bus_coordinates(generators.bus)
+    ax.scatter(
+      xy[:, 0], xy[:, 1], marker='o', s=100, color='yellow',
+      transform=_PLATE_CARREE, zorder=5, label='Generators'
+    )
+    self._draw_labels(ax, xy, generators.index, ha='left')
 
   def plot_loads(self, ax: Axes) -> None:
-    for _, load in self.network.loads.iterrows():
-      bus = self.network.buses.loc[load.bus]
-      ax.plot(
-        bus.x, bus.y, marker='o', markersize=10, color='black',
-        transform=ccrs.PlateCarree(), zorder=5, label='Loads'
-      )
-      ax.text(
-        bus.x, bus.y, load.name, transform=ccrs.PlateCarree(),
-        fontsize=8, zorder=5, ha='left'
-      )
+    loads = self._drop_unknown_buses('loads', self.network.loads, 'bus')
+    if loads.empty:
+      return
+    xy = self._bus_coordinates(loads.bus)
+    ax.scatter(
+      xy[:, 0], xy[:, 1], marker='o', s=100, color='black',
+      transform=_PLATE_CARREE, zorder=5, label='Loads'
+    )
+    self._draw_labels(ax, xy, loads.index, ha='left')
 
   def plot_transformers(self, ax: Axes) -> None:
-    for _, transformer in self.network.transformers.iterrows():
-      bus0 = self.network.buses.loc[transformer.bus0]
-      bus1 = self.network.buses.loc[transformer.bus1]
-      ax.plot(
-        [bus0.x, bus1.x], [bus0.y, bus1.y], transform=ccrs.PlateCarree(),
-        color='purple', linestyle='-', linewidth=1.5, zorder=1
-      )
-      ax.text(
-        0.5 * (bus0.x + bus1.x), 0.5 * (bus0.y + bus1.y), transformer.name,
-        transform=ccrs.PlateCarree(), fontsize=8, zorder=5, ha='center'
-      )
+    transformers, segments = self._segments('transformers')
+    self._draw_connection_collection(ax, transformers, segments, colors='purple', linestyles='-')
 
   def plot_storage_units(self, ax: Axes) -> None:
-    for _, storage_unit in self.network.storage_units.iterrows():
-      bus = self.network.buses.loc[storage_unit.bus]
-      ax.plot(
-        bus.x, bus.y, marker='o', markersize=10, color='green',
-        transform=ccrs.PlateCarree(), zorder=5, label='Storage Units'
-      )
-      ax.text(
-        bus.x, bus.y, storage_unit.name, transform=ccrs.PlateCarree(),
-        fontsize=8, zorder=5, ha='right'
-      )
+    storage_units = self._drop_unknown_buses('storage units', self.network.storage_units, 'bus')
+    if storage_units.empty:
+      return
+    xy = self._bus_coordinates(storage_units.bus)
+    ax.scatter(
+      xy[:, 0], xy[:, 1], marker='o', s=100, color='green',
+      transform=_PLATE_CARREE, zorder=5, label='Storage Units'
+    )
+    self._draw_labels(ax, xy, storage_units.index, ha='right')
 
   def plot_links(self, ax: Axes) -> None:
-    for _, link in self.network.links.iterrows():
-      bus0 = self.network.buses.loc[link.bus0]
-      bus1 = self.network.buses.loc[link.bus1]
-      ax.plot(
-        [bus0.x, bus1.x], [bus0.y, bus1.y], transform=ccrs.PlateCarree(),
-        color='brown', linestyle='-', linewidth=1.5, zorder=1
-      )
-      ax.text(
-        0.5 * (bus0.x + bus1.x), 0.5 * (bus0.y + bus1.y), link.name,
-        transform=ccrs.PlateCarree(), fontsize=8, zorder=5, ha='center'
-      )
+    links, segments = self._segments('links')
+    self._draw_connection_collection(ax, links, segments, colors='brown', linestyles='-')
 
   def add_map_features(self, ax: Axes) -> None:
+    # Imported here so plots without map features never load cartopy.feature
+    import cartopy.feature as cfeature
     ax.add_feature(cfeature.LAND)
     ax.add_feature(cfeature.OCEAN)
     ax.add_feature(cfeature.COASTLINE)
@@ -111,38 +136,50 @@ class Network_Plot:
     ax.add_feature(cfeature.RIVERS)
 
   def set_plot_extent(self, ax: Axes) -> None:
-    ax.set_extent([
-      self.network.buses.x.min() - 6, self.network.buses.x.max() + 6,
-      self.network.buses.y.min() - 6, self.network.buses.y.max() + 6
-    ])
+    xy = self.network.buses[['x', 'y']].to_numpy()
+    min_x, min_y = np.nanmin(xy, axis=0)
+    max_x, max_y = np.nanmax(xy, axis=0)
+    ax.set_extent([min_x - 6, max_x + 6, min_y - 6, max_y + 6])
 
   def create_legend(self, ax: Axes) -> None:
-    handles, labels = ax.get_legend_handles_labels()
-    by_label = dict(zip(labels, handles))
-    ax.legend(by_label.values(), by_label.keys())
+    # Each component type draws a single labelled artist, so no de-duplication is needed
+    ax.legend()
 
-  def plot_network(self) -> None:
+  def plot_network(self, save_path: Optional[str] = None) -> None:
     """
-    Plot the network
+    Plot the network. When save_path is given, the figure is rendered off-screen
+    on an Agg canvas and written to that file instead of being shown.
     """
-    fig = plt.figure(figsize=(12, 12))
-    ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
+    if save_path is None:
+      fig = plt.figure(figsize=(12, 12))
+    else:
+      fig = Figure(figsize=(12, 12))
+      FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1, projection=_PLATE_CARREE)
     #self.add_map_features(ax)
 
-    self.set_plot_extent(ax)
-    self.plot_buses(ax)
-    self.plot_lines(ax)
-    self.plot_generators(ax)
-    self.plot_storage_units(ax)
-    self.plot_links(ax)
-    self.plot_transformers(ax)
-    self.plot_loads(ax)
-    self.create_legend(ax)
-    plt.show()
-
-  def main(self) -> None:
-    self.logger.info(f'Plotting {len(self.network.buses)} buses and {len(self.network.lines)} lines...')
-    self.plot_network()
+    # Slice the bus coordinates once for every component lookup in this plot
+    self._bus_xy = self.network.buses[['x', 'y']]
+    try:
+      self.set_plot_extent(ax)
+      self.plot_buses(ax)
+      self.plot_lines(ax)
+      self.plot_generators(ax)
+      self.plot_storage_units(ax)
+      self.plot_links(ax)
+      self.plot_transformers(ax)
+      self.plot_loads(ax)
+      self.create_legend(ax)
+    finally:
+      self._bus_xy = None
+    if save_path is None:
+      plt.show()
+    else:
+      fig.savefig(save_path, dpi=300, bbox_inches='tight')
+
+  def main(self, save_path: Optional[str] = None) -> None:
+    self.logger.info('Plotting %d buses and %d lines...', len(self.network.buses), len(self.network.lines))
+    self.plot_network(save_path)
 
 if __name__ == '__main__':
   data_folder = 'data'
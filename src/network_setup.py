@@ -1,8 +1,9 @@
 import pypsa
+import numpy as np
 import pandas as pd
-from data_loader import Data_Loader
+from data_loader import Data_Loader, ALLOWED_FILES
 from logger_setup import Logger_Setup
-from typing import Any
+from typing import Any, Dict
 
 class Network_Setup:
     """
@@ -11,39 +12,66 @@ class Network_Setup:
         data_folder (str): Path to the folder containing network data files.
         network (pypsa.Network): Instance of the PyPSA Network.
     """
+    __slots__ = ('data_folder', 'network', 'data_loader', 'logger', '_component_data')
+
+    # Built once and shared by every instance; set_snapshots copies rather than mutates it
+    _SNAPSHOTS = pd.date_range("2024-10-01", periods=24, freq="h")
+
     def __init__(self, data_folder: str) -> None:
         self.data_folder: str = data_folder
         self.network: pypsa.Network = pypsa.Network()
-        self.network.set_snapshots(pd.date_range("2024-10-01", periods=24, freq="h"))
+        self.network.set_snapshots(Network_Setup._SNAPSHOTS)
         self.data_loader: Data_Loader = Data_Loader(data_folder)
         self.logger: Any = Logger_Setup.setup_logger('NetworkSetup')
+        self._component_data: Dict[str, pd.DataFrame] = {}
 
         # Define necessary carriers for buses, lines, and links
         self._add_carriers()
 
     def _add_carriers(self) -> None:
         carriers = ["AC", "DC", "electricity"]
-        for carrier in carriers:
-            self.network.add("Carrier", carrier)
+        self.network.add("Carrier", carriers)
 
     def setup_network(self) -> None:
-        self._add_buses()
-        self._add_generators()
-        self._add_storage_units()
-        self._add_lines()
-        self._add_transformers()
-        self._add_links()
-        self._add_loads()
+        try:
+            # Read every component file up front so the I/O overlaps
+            self._component_data = self.data_loader.read_all(ALLOWED_FILES)
+            self._add_buses()
+            self._add_generators()
+            self._add_storage_units()
+            self._add_lines()
+            self._add_transformers()
+            self._add_links()
+            self._add_loads()
+        except Exception:
+            self.logger.exception("Network setup failed.")
+            raise
+        finally:
+            self._component_data = {}
         self.logger.info("Network was setup successfully!\n")
 
+    def _read_component_data(self, data_file: str) -> pd.DataFrame:
+        data = self._component_data.pop(data_file, None)
+        if data is None:
+            data = self.data_loader.read_csv(data_file)
+        return data
+
+    def _column(self, data: pd.DataFrame, key: str, default: Any) -> Any:
+        # Values for network.add, or default if the file lacks the column; a single row is
+        # passed as a scalar because PyPSA warns about every one-element sequence
+        if key not in data.columns:
+            return default
+        return data[key].iloc[0] if len(data) == 1 else data[key].to_numpy()
+
     def _add_component(self, component_type: str, data_file: str, **kwargs: Any) -> None:
-        data: pd.DataFrame = self.data_loader.read_csv(data_file)
+        data: pd.DataFrame = self._read_component_data(data_file)
         if not data.empty:
-            for _, row in data.iterrows():
-                self.network.add(component_type, row['name'], **{key: row.get(key, kwargs[key]) for key in kwargs})
-            self.logger.info(f"{component_type} added successfully!\n")
+            # Add every row in one call; attributes missing from the file fall back to their default
+            self.network.add(component_type, data['name'].tolist(),
+                **{key: self._column(data, key, value) for key, value in kwargs.items()})
+            self.logger.info("%s added successfully!\n", component_type)
         else:
-            self.logger.warning(f"No {component_type} were added to the network.")
+            self.logger.warning("No %s were added to the network.", component_type)
 
     def _add_buses(self) -> None:
         self._add_component("Bus", 'buses.csv',
@@ -94,27 +122,32 @@ class Network_Setup:
         )
 
     def _add_lines(self) -> None:
-        data: pd.DataFrame = self.data_loader.read_csv('lines.csv')
+        data: pd.DataFrame = self._read_component_data('lines.csv')
         if not data.empty:
-            for _, row in data.iterrows():
-                self._add_line(row)
+            # Derive the line impedances for all rows in one vector pass
+            length = data['length'].to_numpy()
+            data = data.assign(r=data['r_per_length'].to_numpy() * length, x=data['x_per_length'].to_numpy() * length)
+            self._add_line(data)
             self.logger.info("Lines added successfully!\n")
         else:
             self.logger.warning("No lines were added to the network.")
 
-    def _add_line(self, row: pd.Series) -> None:
-        self.network.add("Line", row['name'],
-            bus0=row.get('bus0', ''),
-            bus1=row.get('bus1', ''),
-            length=row.get('length', 0.0),
-            r_per_length=row.get('r_per_length', 0.0),
-            x_per_length=row.get('x_per_length', 0.0),
-            c_per_length=row.get('c_per_length', 0.0),
-            s_nom=row.get('s_nom', 0.0),
-            r=row['r_per_length'] * row['length'],
-            x=row['x_per_length'] * row['length'],
-            capital_cost=row.get('capital_cost', 0.0),
-            carrier=row.get('carrier', '')
+    def _add_line(self, data: pd.DataFrame) -> None:
+        def column(key: str, default: Any) -> Any:
+            return self._column(data, key, default)
+
+        self.network.add("Line", data['name'].tolist(),
+            bus0=column('bus0', ''),
+            bus1=column('bus1', ''),
+            length=column('length', 0.0),
+            r_per_length=column('r_per_length', 0.0),
+            x_per_length=column('x_per_length', 0.0),
+            c_per_length=column('c_per_length', 0.0),
+            s_nom=column('s_nom', 0.0),
+            r=column('r', 0.0),
+            x=column('x', 0.0),
+            capital_cost=column('capital_cost', 0.0),
+            carrier=column('carrier', '')
         )
 
     def _add_transformers(self) -> None:
@@ -156,24 +189,38 @@ class Network_Setup:
         )
 
     def _add_loads(self) -> None:
-        loads: pd.DataFrame = self.data_loader.read_csv('loads.csv')
+        loads: pd.DataFrame = self._read_component_data('loads.csv')
         if loads.empty:
             self.logger.warning("No loads were added to the network.")
             return
-        for _, load in loads.iterrows():
-            self._add_load(load)
+        self._add_load(loads)
         self.logger.info("Loads added successfully!\n")
 
-    def _add_load(self, load: pd.Series) -> None:
-        self.network.add("Load", load['name'],
-            bus=load.get('bus', ''),
-            p_set=pd.Series([float(x) for x in load.get('p_set', '').split(',')], index=self.network.snapshots),
-            q_set=pd.Series([float(x) for x in load.get('q_set', '').split(',')], index=self.network.snapshots),
-            p_min=load.get('p_min', 0.0),
-            p_max=load.get('p_max', 0.0),
-            scaling_factor=load.get('scaling_factor', 1.0),
-            status=load.get('active', True),
-            carrier=load.get('carrier', '')
+    def _add_load(self, loads: pd.DataFrame) -> None:
+        names = loads['name'].tolist()
+
+        def column(key: str, default: Any) -> Any:
+            return self._column(loads, key, default)
+
+        def profile(key: str) -> pd.DataFrame:
+            # Parse every load's comma-separated series at once into a (snapshots x loads) frame
+            cells = loads[key].to_numpy() if key in loads.columns else [''] * len(loads)
+            split = pd.Series(cells, dtype=object).str.split(',', expand=True)
+            # Rows with too few values leave gaps, rows with too many widen the frame
+            if split.shape[1] != len(self.network.snapshots) or split.isnull().to_numpy().any():
+                raise ValueError(f"Every load {key} must have {len(self.network.snapshots)} comma-separated values.")
+            values = split.to_numpy(dtype=np.float64)
+            return pd.DataFrame(values.T, index=self.network.snapshots, columns=names)
+
+        self.network.add("Load", names,
+            bus=column('bus', ''),
+            p_set=profile('p_set'),
+            q_set=profile('q_set'),
+            p_min=column('p_min', 0.0),
+            p_max=column('p_max', 0.0),
+            scaling_factor=column('scaling_factor', 1.0),
+            status=column('active', True),
+            carrier=column('carrier', '')
         )
 
     def get_network(self) -> pypsa.Network:
@@ -0,0 +1,73 @@
+import os
+import pytest
+import pandas as pd
+from unittest.mock import patch
+from data_loader import Data_Loader
+
+BUSES = 'name,v_nom,x,y,carrier\nbus1,110.0,0.0,0.0,AC\nbus2,220.0,1.0,1.0,DC\n'
+
+def write_csv(path, content):
+    path.write_text(content)
+
+@pytest.fixture
+def data_folder(tmp_path):
+    write_csv(tmp_path / 'buses.csv', BUSES)
+    return tmp_path
+
+def test_read_csv_is_cached_until_file_changes(data_folder):
+    data_loader = Data_Loader(str(data_folder))
+    with patch.object(pd, 'read_csv', wraps=pd.read_csv) as read_csv:
+        first = data_loader.read_csv('buses.csv')
+        second = data_loader.read_csv('buses.csv')
+        assert read_csv.call_count == 1
+        pd.testing.assert_frame_equal(first, second)
+
+        # Rewrite within the same mtime tick, as on a filesystem with coarse timestamps
+        stat = os.stat(data_folder / 'buses.csv')
+        write_csv(data_folder / 'buses.csv', BUSES.replace('110.0', '1320.0'))
+        os.utime(data_folder / 'buses.csv', ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        edited = data_loader.read_csv('buses.csv')
+        assert read_csv.call_count == 2
+    assert edited.loc[0, 'v_nom'] == 1320.0
+
+def test_read_csv_returns_independent_copies(data_folder):
+    data_loader = Data_Loader(str(data_folder))
+    data = data_loader.read_csv('buses.csv')
+    data.loc[0, 'v_nom'] = -1.0
+    assert data_loader.read_csv('buses.csv').loc[0, 'v_nom'] == 110.0
+
+def test_convert_to_parquet_round_trip(data_folder):
+    pytest.importorskip('pyarrow')
+    data_loader = Data_Loader(str(data_folder))
+    expected = data_loader.read_csv('buses.csv')
+    data_loader.convert_to_parquet()
+    assert (data_folder / 'buses.parquet').exists()
+    pd.testing.assert_frame_equal(pd.read_parquet(data_folder / 'buses.parquet'), expected)
+    assert expected['carrier'].dtype == 'category'
+
+def test_read_csv_prefers_parquet_until_csv_is_newer(data_folder):
+    pytest.importorskip('pyarrow')
+    data_loader = Data_Loader(str(data_folder))
+    parquet_path = data_folder / 'buses.parquet'
+    parquet_data = data_loader.read_csv('buses.csv').assign(v_nom=[11.0, 22.0])
+    parquet_data.to_parquet(parquet_path, index=False)
+    stat = os.stat(data_folder / 'buses.csv')
+    os.utime(parquet_path, (stat.st_atime, stat.st_mtime + 10))
+    assert data_loader.read_csv('buses.csv')['v_nom'].tolist() == [11.0, 22.0]
+
+    os.utime(data_folder / 'buses.csv', (stat.st_atime, stat.st_mtime + 20))
+    assert data_loader.read_csv('buses.csv')['v_nom'].tolist() == [110.0, 220.0]
+
+@pytest.mark.parametrize('file_name, content, error', [
+    ('lines.csv', None, FileNotFoundError),
+    ('lines.csv', '', pd.errors.EmptyDataError),
+    ('constraints.csv', 'name\n', ValueError),
+])
+def test_read_errors_propagate(data_folder, file_name, content, error):
+    if content is not None:
+        write_csv(data_folder / file_name, content)
+    data_loader = Data_Loader(str(data_folder))
+    with pytest.raises(error):
+        data_loader.read_csv(file_name)
+    with pytest.raises(error):
+        data_loader.read_all(['buses.csv', file_name])
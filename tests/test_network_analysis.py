@@ -0,0 +1,25 @@
+import pytest
+import pandas as pd
+from unittest.mock import MagicMock, patch
+from network_analysis import Network_Analysis
+
+def test_analysis_reuses_given_network():
+    network = MagicMock(
+        storage_units=pd.DataFrame(),
+        transformers=pd.DataFrame(),
+        lines_t=MagicMock(p0=pd.DataFrame(), p1=pd.DataFrame()),
+        buses_t=MagicMock(p_set=pd.DataFrame(), p=pd.DataFrame())
+    )
+    with patch('network_analysis.Network_Setup') as MockNetworkSetup:
+        network_analysis = Network_Analysis(network=network)
+        MockNetworkSetup.assert_not_called()
+    assert network_analysis.network is network
+
+    network_analysis.analyze_network()
+    network_analysis.analyze_network()
+    network.consistency_check.assert_called_once()
+    assert network.pf.call_count == 2
+
+def test_analysis_requires_data_folder_or_network():
+    with pytest.raises(ValueError, match='data_folder or network is required'):
+        Network_Analysis()
@@ -1,41 +1,24 @@
 import pytest
+import pandas as pd
 from unittest.mock import MagicMock, patch
 import matplotlib.pyplot as plt
-from src.network_plot import Network_Plot
+from network_plot import Network_Plot
 
 @pytest.fixture
 def mock_network_setup():
-    with patch('src.network_plot.Network_Setup') as MockNetworkSetup:
+    with patch('network_plot.Network_Setup') as MockNetworkSetup:
         mock_network_setup = MockNetworkSetup.return_value
         mock_network_setup.get_network.return_value = MagicMock(
-            buses=MagicMock(
-                x=[0, 1],
-                y=[0, 1],
-                iterrows=MagicMock(return_value=iter([
-                    ('bus1', MagicMock(x=0, y=0)),
-                    ('bus2', MagicMock(x=1, y=1))
-                ]))
+            buses=pd.DataFrame({'x': [0.0, 1.0], 'y': [0.0, 1.0]}, index=['bus1', 'bus2']),
+            lines=pd.DataFrame(
+                {'bus0': ['bus1'], 'bus1': ['bus2'], 's_nom': [200.0], 'type': ['']},
+                index=['line1']
             ),
-            lines=MagicMock(
-                iterrows=MagicMock(return_value=iter([
-                    (0, MagicMock(bus0='bus1', bus1='bus2'))
-                ]))
-            ),
-            links=MagicMock(
-                iterrows=MagicMock(return_value=iter([
-                    (0, MagicMock(bus0='bus1', bus1='bus2'))
-                ]))
-            ),
-            transformers=MagicMock(
-                iterrows=MagicMock(return_value=iter([
-                    (0, MagicMock(bus0='bus1', bus1='bus2'))
-                ]))
-            ),
-            generators=MagicMock(
-                iterrows=MagicMock(return_value=iter([
-                    (0, MagicMock(bus='bus1', name='gen1'))
-                ]))
-            )
+            links=pd.DataFrame({'bus0': ['bus1'], 'bus1': ['bus2']}, index=['link1']),
+            transformers=pd.DataFrame({'bus0': ['bus1'], 'bus1': ['bus2']}, index=['transformer1']),
+            generators=pd.DataFrame({'bus': ['bus1']}, index=['gen1']),
+            loads=pd.DataFrame({'bus': ['bus2']}, index=['load1']),
+            storage_units=pd.DataFrame({'bus': ['bus2']}, index=['storage1'])
         )
         yield mock_network_setup
 
@@ -46,4 +29,45 @@ def network_plot(mock_network_setup):
 def test_plot_network(network_plot):
     with patch.object(plt, 'show'):
         network_plot.plot_network()
-        plt.show.assert_called_once()
\ No newline at end of file
+        plt.show.assert_called_once()
+
+def test_plot_network_save_path(network_plot, tmp_path):
+    save_path = tmp_path / 'network.png'
+    with patch.object(plt, 'show'):
+        network_plot.plot_network(save_path=str(save_path))
+        plt.show.assert_not_called()
+    assert save_path.exists()
+
+def test_plot_reuses_given_network(mock_network_setup):
+    network = mock_network_setup.get_network.return_value
+    with patch('network_plot.Network_Setup') as MockNetworkSetup:
+        network_plot = Network_Plot(network=network)
+        MockNetworkSetup.assert_not_called()
+    assert network_plot.network is network
+
+def test_plot_requires_data_folder_or_network():
+    with pytest.raises(ValueError, match='data_folder or network is required'):
+        Network_Plot()
+
+def test_segments_follow_moved_buses(network_plot):
+    _, segments = network_plot._segments('lines')
+    assert segments[0, 1].tolist() == [1.0, 1.0]
+    network_plot.network.buses.loc['bus2', 'x'] = 99.0
+    _, segments = network_plot._segments('lines')
+    assert segments[0, 1].tolist() == [99.0, 1.0]
+
+def test_legend_omits_absent_components():
+    network = MagicMock(
+        buses=pd.DataFrame({'x': [0.0, 1.0], 'y': [0.0, 1.0]}, index=['bus1', 'bus2']),
+        lines=pd.DataFrame(columns=['bus0', 'bus1', 's_nom', 'type']),
+        links=pd.DataFrame(columns=['bus0', 'bus1']),
+        transformers=pd.DataFrame(columns=['bus0', 'bus1']),
+        generators=pd.DataFrame({'bus': ['bus1']}, index=['gen1']),
+        loads=pd.DataFrame(columns=['bus']),
+        storage_units=pd.DataFrame(columns=['bus'])
+    )
+    network_plot = Network_Plot(network=network)
+    with patch.object(plt, 'show'):
+        network_plot.plot_network()
+        legend = plt.gcf().axes[0].get_legend()
+    assert [text.get_text() for text in legend.get_texts()] == ['Buses', 'Generators']
@@ -1,12 +1,13 @@
+import logging
 import pytest
 import pandas as pd
 from unittest.mock import MagicMock
-from src.network_setup import Network_Setup
-from src.data_loader import DataLoader
+from network_setup import Network_Setup
+from data_loader import Data_Loader
 
 @pytest.fixture
 def mock_data_loader():
-    data_loader = DataLoader('data')
+    data_loader = Data_Loader('data')
     data_loader.read_csv = MagicMock()
     return data_loader
 
@@ -65,6 +66,20 @@ def test_add_storage_units(network_setup, mock_data_loader):
     assert 'storage1' in network_setup.network.storage_units.index
     assert 'storage2' in network_setup.network.storage_units.index
 
+def test_add_single_storage_unit_without_warnings(network_setup, mock_data_loader, caplog):
+    mock_data_loader.read_csv.return_value = pd.DataFrame({
+        'name': ['storage1'],
+        'bus': ['bus1'],
+        'p_nom': [50],
+        'max_hours': [4],
+        'cyclic_state_of_charge': [True]
+    })
+    network_setup.network.add('Bus', 'bus1')
+    with caplog.at_level(logging.WARNING):
+        network_setup._add_storage_units()
+    assert network_setup.network.storage_units.loc['storage1', 'p_nom'] == 50
+    assert not [record for record in caplog.records if record.levelno >= logging.WARNING]
+
 def test_add_lines(network_setup, mock_data_loader):
     mock_data_loader.read_csv.return_value = pd.DataFrame({
         'name': ['line1', 'line2'],
@@ -126,12 +141,15 @@ def test_add_links(network_setup, mock_data_loader):
     assert 'link1' in network_setup.network.links.index
     assert 'link2' in network_setup.network.links.index
 
+def profile(value, periods=24):
+    return ','.join([str(value)] * periods)
+
 def test_add_loads(network_setup, mock_data_loader):
     mock_data_loader.read_csv.return_value = pd.DataFrame({
         'name': ['load1', 'load2'],
         'bus': ['bus1', 'bus2'],
-        'p_set': ['1.0,2.0', '3.0,4.0'],
-        'q_set': ['0.5,1.0', '1.5,2.0'],
+        'p_set': [profile(1.0), profile(3.0)],
+        'q_set': [profile(0.5), profile(1.5)],
         'p_min': [0.0, 0.0],
         'p_max': [10.0, 20.0],
         'scaling_factor': [1.0, 1.0],
@@ -142,4 +160,25 @@ def test_add_loads(network_setup, mock_data_loader):
     })
     network_setup._add_loads()
     assert 'load1' in network_setup.network.loads.index
-    assert 'load2' in network_setup.network.loads.index
\ No newline at end of file
+    assert 'load2' in network_setup.network.loads.index
+    assert network_setup.network.loads_t.p_set['load2'].tolist() == [3.0] * 24
+
+@pytest.mark.parametrize('p_set', [profile(1.0, periods=23), profile(1.0, periods=25), None])
+def test_add_loads_rejects_bad_profiles(network_setup, mock_data_loader, p_set):
+    loads = pd.DataFrame({
+        'name': ['load1', 'load2'],
+        'bus': ['bus1', 'bus2'],
+        'p_set': [profile(1.0), p_set],
+        'q_set': [profile(0.5), profile(1.5)]
+    })
+    if p_set is None:
+        loads = loads.drop(columns='p_set')
+    mock_data_loader.read_csv.return_value = loads
+    with pytest.raises(ValueError, match='24 comma-separated values'):
+        network_setup._add_loads()
+
+def test_setup_network_stops_on_missing_files(tmp_path):
+    network_setup = Network_Setup(str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        network_setup.setup_network()
+    assert network_setup.network.buses.empty